@@ -1,16 +1,19 @@
 """FastAPI application exposing simulation and webhook endpoints."""
 from __future__ import annotations
 
-from typing import Dict, List
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 from fastapi import Depends, FastAPI, HTTPException, Path
+from fastapi.responses import ORJSONResponse
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from api.deps import require_api_key
+from api.middleware import APIKeyMiddleware
 from api.schemas import (
     TestCaseSchema,
-    TurnExpectationSchema,
     TestRunDetailResponse,
     TestRunMode,
     TestRunRequest,
@@ -18,133 +21,210 @@ from api.schemas import (
     TestRunSummary,
     WebhookEvent,
 )
-from core.config import Settings, get_settings
-from core.database import get_session, init_db
+from core.config import SettingsSnapshot, get_settings
+from core.database import get_session, get_write_session, init_db
 from core.telephony import SIPTrunkProvider, TelephonyProvider, TwilioProvider, ZoomPhoneProvider
 from models.db_models import TestCaseRecord, TestRun
 from services.evaluator import EvaluatorService
 from services.llm import build_llm_client
 from services.simulator import SimulatorAgent
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
-llm_client = build_llm_client(settings)
+# With LLMs disabled no provider client is built, so the SDKs are never imported;
+# the simulator and evaluator fall back to their deterministic implementations.
+llm_client = build_llm_client(settings) if settings.enable_llm else None
 
-app = FastAPI(
-    title="Voice Agent Testing",
-    version="0.1.0",
-    dependencies=[Depends(require_api_key)],
-)
 simulator = SimulatorAgent(llm_client=llm_client, naturalize_user_prompts=True, disfluency_rate=0.15)
 evaluator = EvaluatorService(llm_client=llm_client)
 
 
-@app.on_event("startup")
-async def _startup() -> None:
+async def _warm_caches() -> None:
+    """Pay one-time client construction costs before the first request arrives."""
+
+    if _twilio_configured(settings):
+        try:
+            _resolve_provider(settings, "twilio").warmup()
+        except Exception:  # noqa: BLE001 - warmup must never block startup
+            logger.warning("Twilio provider warmup failed", exc_info=True)
+    warmup = getattr(llm_client, "warmup", None)
+    if warmup is not None:
+        try:
+            await warmup()
+        except Exception:  # noqa: BLE001 - warmup must never block startup
+            logger.warning("LLM client warmup failed", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     await init_db()
+    await _warm_caches()
+    yield
+    aclose = getattr(llm_client, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+app = FastAPI(
+    title="Voice Agent Testing",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+app.add_middleware(
+    APIKeyMiddleware,
+    exempt_paths=(app.docs_url, app.redoc_url, app.openapi_url, app.swagger_ui_oauth2_redirect_url, "/health"),
+)
 
 
 async def _fetch_test_case(session: AsyncSession, test_id: str) -> TestCaseRecord:
-    statement = select(TestCaseRecord).where(TestCaseRecord.test_id == test_id)
-    result = await session.exec(statement)
-    record = result.one_or_none()
+    record = await session.get(TestCaseRecord, test_id)
     if not record:
         raise HTTPException(status_code=404, detail=f"Test case '{test_id}' not found")
     return record
 
 
-def _resolve_provider(settings: Settings, provider_name: str) -> TelephonyProvider:
-    provider_name = provider_name.lower()
-    if provider_name == "twilio":
-        if not (settings.twilio_account_sid and settings.twilio_auth_token and settings.twilio_default_from):
-            raise HTTPException(status_code=500, detail="Twilio credentials are not configured")
-        return TwilioProvider(
-            account_sid=settings.twilio_account_sid,
-            auth_token=settings.twilio_auth_token,
-            default_from_number=settings.twilio_default_from,
-        )
-    if provider_name == "zoom_phone":
-        return ZoomPhoneProvider()
-    if provider_name == "sip_trunk":
-        return SIPTrunkProvider()
-    raise HTTPException(status_code=400, detail=f"Unsupported provider '{provider_name}'")
+def _twilio_configured(settings: SettingsSnapshot) -> bool:
+    return bool(settings.twilio_account_sid and settings.twilio_auth_token and settings.twilio_default_from)
 
 
-def _serialize_test_case(record: TestCaseRecord) -> TestCaseSchema:
-    return TestCaseSchema(
-        test_id=record.test_id,
-        persona=record.persona,
-        turns=[TurnExpectationSchema(**turn) for turn in record.turns],
+def _build_twilio_provider(settings: SettingsSnapshot) -> TelephonyProvider:
+    if not _twilio_configured(settings):
+        raise HTTPException(status_code=500, detail="Twilio credentials are not configured")
+    return TwilioProvider(
+        account_sid=settings.twilio_account_sid,
+        auth_token=settings.twilio_auth_token,
+        default_from_number=settings.twilio_default_from,
     )
 
 
-def _serialize_test_run(run: TestRun) -> TestRunSummary:
-    return TestRunSummary(
-        run_id=run.id,
-        test_id=run.test_id,
-        provider=run.provider,
-        status=run.status,
-        mode=run.mode,
-        created_at=run.created_at,
-        updated_at=run.updated_at,
-        provider_call_id=run.provider_call_id,
-        evaluation=run.evaluation,
-    )
+_PROVIDER_FACTORIES: Dict[str, Callable[[SettingsSnapshot], TelephonyProvider]] = {
+    "twilio": _build_twilio_provider,
+    "zoom_phone": lambda _settings: ZoomPhoneProvider(),
+    "sip_trunk": lambda _settings: SIPTrunkProvider(),
+}
+# Keyed on the frozen settings snapshot too, so an overridden snapshot never reuses a
+# provider built from another snapshot's credentials.
+_PROVIDER_CACHE: Dict[Tuple[str, SettingsSnapshot], TelephonyProvider] = {}
+
+
+def _resolve_provider(settings: SettingsSnapshot, provider_name: str) -> TelephonyProvider:
+    cache_key = (provider_name.lower(), settings)
+    try:
+        return _PROVIDER_CACHE[cache_key]
+    except KeyError:
+        pass
+    factory = _PROVIDER_FACTORIES.get(cache_key[0])
+    if factory is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported provider '{cache_key[0]}'")
+    provider = factory(settings)
+    _PROVIDER_CACHE[cache_key] = provider
+    return provider
+
+
+# Summary columns only: listing runs never loads or decodes their transcript JSON.
+_RUN_SUMMARY_COLUMNS = (
+    TestRun.id.label("run_id"),
+    TestRun.test_id,
+    TestRun.provider,
+    TestRun.status,
+    TestRun.mode,
+    TestRun.created_at,
+    TestRun.updated_at,
+    TestRun.provider_call_id,
+    TestRun.evaluation,
+)
+
+
+def _test_run_payload(run: TestRun) -> Dict[str, Any]:
+    return {
+        "run_id": run.id,
+        "test_id": run.test_id,
+        "provider": run.provider,
+        "status": run.status,
+        "mode": run.mode,
+        "created_at": run.created_at,
+        "updated_at": run.updated_at,
+        "provider_call_id": run.provider_call_id,
+        "evaluation": run.evaluation,
+    }
+
 
+@app.get("/health")
+async def health() -> Dict[str, str]:
+    """Unauthenticated liveness probe; also lets clients open a pooled connection cheaply."""
+    return {"status": "ok"}
 
+
+# List endpoints return ORJSONResponse directly: response_model still documents the
+# shape in OpenAPI, but FastAPI skips re-validating rows that are already trusted.
 @app.get("/testcases", response_model=List[TestCaseSchema])
-async def list_test_cases(session: AsyncSession = Depends(get_session)) -> List[TestCaseSchema]:
-    result = await session.exec(select(TestCaseRecord).order_by(TestCaseRecord.test_id))
-    records = result.all()
-    return [_serialize_test_case(record) for record in records]
+async def list_test_cases(session: AsyncSession = Depends(get_session)) -> ORJSONResponse:
+    # Column-only select: rows go straight to JSON without ORM entity materialization.
+    # Stored turns were validated as TurnExpectation on insert and match the schema.
+    statement = select(TestCaseRecord.test_id, TestCaseRecord.persona, TestCaseRecord.turns).order_by(
+        TestCaseRecord.test_id
+    )
+    result = await session.exec(statement)
+    return ORJSONResponse(
+        [{"test_id": test_id, "persona": persona, "turns": turns} for test_id, persona, turns in result.all()]
+    )
 
 
 @app.get("/testruns", response_model=List[TestRunSummary])
 async def list_test_runs(
     limit: int = 10,
     session: AsyncSession = Depends(get_session),
-) -> List[TestRunSummary]:
+) -> ORJSONResponse:
     limit = max(1, min(limit, 100))
-    statement = select(TestRun).order_by(TestRun.created_at.desc()).limit(limit)
-    result = await session.exec(statement)
-    runs = result.all()
-    return [_serialize_test_run(run) for run in runs]
+    statement = select(*_RUN_SUMMARY_COLUMNS).order_by(TestRun.created_at.desc()).limit(limit)
+    result = await session.stream(statement)
+    rows = [dict(row) async for row in result.mappings()]
+    return ORJSONResponse(rows)
 
 
 @app.get("/testruns/{run_id}", response_model=TestRunDetailResponse)
 async def get_test_run(
     run_id: str,
     session: AsyncSession = Depends(get_session),
-) -> TestRunDetailResponse:
+) -> ORJSONResponse:
     test_run = await session.get(TestRun, run_id)
     if not test_run:
         raise HTTPException(status_code=404, detail="Test run not found")
-    summary = _serialize_test_run(test_run)
-    return TestRunDetailResponse(**summary.dict(), transcript=test_run.transcript)
+    # Like the list endpoints, return ORJSONResponse so FastAPI skips re-validating
+    # trusted rows; simulator rows carry no timestamp, so default it to match the schema.
+    transcript = [{"step_order": None, "timestamp": None, **row} for row in test_run.transcript]
+    return ORJSONResponse({**_test_run_payload(test_run), "transcript": transcript})
 
 
 @app.post("/test/run", response_model=TestRunResponse)
 async def run_test_case(
     payload: TestRunRequest,
-    session: AsyncSession = Depends(get_session),
-    settings: Settings = Depends(get_settings),
+    session: AsyncSession = Depends(get_write_session),
+    settings: SettingsSnapshot = Depends(get_settings),
 ) -> TestRunResponse:
+    # Reject bad live-mode requests before touching the database.
+    provider: Optional[TelephonyProvider] = None
+    if payload.mode == TestRunMode.live:
+        if not payload.to_number:
+            raise HTTPException(status_code=400, detail="to_number is required for live mode")
+        provider = _resolve_provider(settings, payload.provider)
+
     record = await _fetch_test_case(session, payload.test_id)
-    test_case = record.to_domain()
     test_run = TestRun(
-        test_id=test_case.test_id,
+        test_id=record.test_id,
         provider=payload.provider,
         mode=payload.mode.value,
-        status="initiated" if payload.mode == TestRunMode.live else "completed",
+        status="initiated" if provider is not None else "completed",
     )
 
-    if payload.mode == TestRunMode.live:
-        if not payload.to_number:
-            raise HTTPException(status_code=400, detail="to_number is required for live mode")
-        provider = _resolve_provider(settings, payload.provider)
+    if provider is not None:
+        # Live calls only need the test id, so the turns are never hydrated here.
         call_result = await provider.initiate_call(
-            to_number=payload.to_number or "",  # real number required in live mode
+            to_number=payload.to_number,
             from_number=payload.from_number or settings.twilio_default_from,
-            test_case_id=test_case.test_id,
+            test_case_id=record.test_id,
             metadata=payload.metadata,
         )
         test_run.provider_call_id = call_result.get("provider_call_id")
@@ -156,11 +236,17 @@ async def run_test_case(
             provider_call_id=test_run.provider_call_id,
         )
 
+    test_case = record.to_domain()
     transcript = await simulator.run(test_case)
     evaluation = await evaluator.evaluate(transcript, test_case)
-    test_run.transcript = transcript
+    # Simulated transcripts are held to the same cap as webhook-appended ones.
+    if test_run.append_transcript(transcript, max_rows=settings.max_transcript_size):
+        logger.warning(
+            "Transcript for run %s exceeded %d rows; dropping the oldest rows",
+            test_run.id,
+            settings.max_transcript_size,
+        )
     test_run.evaluation = evaluation
-    test_run.touch()
     session.add(test_run)
     await session.commit()
     return TestRunResponse(
@@ -175,25 +261,44 @@ async def run_test_case(
 async def provider_webhook(
     event: WebhookEvent,
     provider: str = Path(..., description="Provider slug"),
-    session: AsyncSession = Depends(get_session),
-    settings: Settings = Depends(get_settings),
+    session: AsyncSession = Depends(get_write_session),
+    settings: SettingsSnapshot = Depends(get_settings),
 ) -> Dict[str, object]:
     provider_instance = _resolve_provider(settings, provider)
-    normalized_event = await provider_instance.parse_webhook_event(event.provider_payload)
 
-    result = await session.exec(select(TestRun).where(TestRun.id == event.test_run_id))
-    test_run = result.one_or_none()
+    test_run = await session.get(TestRun, event.test_run_id)
     if not test_run:
         raise HTTPException(status_code=404, detail="Test run not found")
 
-    transcript_rows = [row.dict() for row in event.transcript]
+    # Payload parsing never touches the session, so the test case lookup can overlap it.
+    if event.completed:
+        normalized_event, test_case_record = await asyncio.gather(
+            provider_instance.parse_webhook_event(event.provider_payload),
+            _fetch_test_case(session, test_run.test_id),
+        )
+    else:
+        normalized_event = await provider_instance.parse_webhook_event(event.provider_payload)
+        test_case_record = None
+
+    transcript_rows = [
+        {"speaker": row.speaker, "text": row.text, "step_order": row.step_order, "timestamp": row.timestamp}
+        for row in event.transcript
+    ]
     if transcript_rows:
-        test_run.append_transcript(transcript_rows)
+        previous_size = len(test_run.transcript)
+        dropped = test_run.append_transcript(transcript_rows, max_rows=settings.max_transcript_size)
+        if dropped and previous_size < settings.max_transcript_size:
+            logger.warning(
+                "Transcript for run %s exceeded %d rows; dropping the oldest rows",
+                test_run.id,
+                settings.max_transcript_size,
+            )
 
     response_payload: Dict[str, object] = {"normalized_event": normalized_event}
 
-    if event.completed:
-        test_case_record = await _fetch_test_case(session, test_run.test_id)
+    if test_case_record is not None:
+        # No flush before this await: it would hold SQLite's write lock for the whole
+        # (possibly LLM-backed) evaluation; the appended rows go out in the final commit.
         evaluation = await evaluator.evaluate(test_run.transcript, test_case_record.to_domain())
         test_run.evaluation = evaluation
         test_run.status = "completed"
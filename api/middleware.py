@@ -0,0 +1,40 @@
+"""ASGI middleware applied to every FastAPI request."""
+from __future__ import annotations
+
+import hmac
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.config import get_settings
+
+
+class APIKeyMiddleware:
+    """Reject requests without the configured API key before routing or dependency solving.
+
+    The check runs ahead of routing, so unauthenticated requests to unknown paths get
+    401 rather than 404.
+    """
+
+    def __init__(self, app: ASGIApp, exempt_paths: Iterable[Optional[str]] = ()) -> None:
+        settings = get_settings()
+        self.app = app
+        self.expected_key = settings.api_key.encode() if settings.api_key else None
+        # Starlette header lookups are case-insensitive; pre-lower once.
+        self.header_name = settings.api_key_header_name.lower()
+        self.exempt_paths = frozenset(path for path in exempt_paths if path)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.expected_key is None or scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        provided_key = Headers(scope=scope).get(self.header_name, "")
+        if not hmac.compare_digest(provided_key.encode(), self.expected_key):
+            response = JSONResponse({"detail": "Invalid or missing API key"}, status_code=401)
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
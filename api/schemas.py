@@ -13,7 +13,14 @@ class TestRunMode(str, Enum):
     live = "live"
 
 
-class TranscriptRowModel(BaseModel):
+class FrozenSchema(BaseModel):
+    """Immutable (and hashable) schema for high-volume rows built once and never mutated."""
+
+    class Config:
+        frozen = True
+
+
+class TranscriptRowModel(FrozenSchema):
     speaker: str = Field(..., description="Either 'user' or 'agent'")
     text: str
     step_order: Optional[int] = None
@@ -43,7 +50,7 @@ class WebhookEvent(BaseModel):
     completed: bool = Field(default=False)
 
 
-class TurnExpectationSchema(BaseModel):
+class TurnExpectationSchema(FrozenSchema):
     step_order: int
     user_input: str
     expected_agent_response_keywords: List[str]
@@ -56,7 +63,7 @@ class TestCaseSchema(BaseModel):
     turns: List[TurnExpectationSchema]
 
 
-class TestRunSummary(BaseModel):
+class TestRunSummary(FrozenSchema):
     run_id: str
     test_id: str
     provider: str
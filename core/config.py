@@ -1,10 +1,11 @@
 """Application settings and environment helpers."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import Optional
 
-from pydantic import BaseSettings, Field
+from pydantic import BaseSettings, Field, validator
 
 
 class Settings(BaseSettings):
@@ -14,6 +15,9 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./voice_framework.db",
         description="SQLAlchemy connection string (async driver)",
     )
+    db_pool_size: int = Field(default=20, description="Persistent connections kept by the engine pool")
+    db_max_overflow: int = Field(default=10, description="Extra connections allowed beyond db_pool_size")
+    db_pool_recycle: int = Field(default=1800, description="Seconds before a pooled connection is recycled")
     twilio_account_sid: Optional[str] = Field(default=None)
     twilio_auth_token: Optional[str] = Field(default=None)
     twilio_default_from: Optional[str] = Field(default=None)
@@ -22,15 +26,50 @@ class Settings(BaseSettings):
     anthropic_api_key: Optional[str] = Field(default=None, env="ANTHROPIC_API_KEY")
     anthropic_model: str = Field(default="claude-3-5-sonnet-20241022")
     llm_temperature: float = Field(default=0.2)
+    llm_cache_size: int = Field(default=4096, description="Cached temperature-0 LLM responses; 0 disables")
+    llm_cache_ttl: float = Field(default=3600.0, description="Seconds a cached LLM response stays valid")
+    enable_llm: bool = Field(default=True, description="Use configured LLM providers for simulation/evaluation")
     api_key: Optional[str] = Field(default=None, env="VOICE_API_KEY")
     api_key_header_name: str = Field(default="x-api-key")
+    max_transcript_size: int = Field(default=2000, description="Newest transcript rows kept per test run")
 
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
 
+    @validator("max_transcript_size")
+    def _positive_transcript_size(cls, value: int) -> int:
+        """A non-positive cap would slice the wrong rows off the transcript."""
+        if value <= 0:
+            raise ValueError("max_transcript_size must be a positive integer")
+        return value
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    """Immutable slotted copy of Settings read on request paths."""
+
+    database_url: str
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_recycle: int
+    twilio_account_sid: Optional[str]
+    twilio_auth_token: Optional[str]
+    twilio_default_from: Optional[str]
+    openai_api_key: Optional[str]
+    openai_model: str
+    anthropic_api_key: Optional[str]
+    anthropic_model: str
+    llm_temperature: float
+    llm_cache_size: int
+    llm_cache_ttl: float
+    enable_llm: bool
+    api_key: Optional[str]
+    api_key_header_name: str
+    max_transcript_size: int
+
 
 @lru_cache(maxsize=1)
-def get_settings() -> Settings:
-    """Return cached application settings."""
-    return Settings()
+def get_settings() -> SettingsSnapshot:
+    """Parse the environment once and return a cached, frozen settings snapshot."""
+    return SettingsSnapshot(**Settings().dict())
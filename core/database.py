@@ -2,19 +2,42 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import orjson
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from core.config import get_settings
+from core.config import SettingsSnapshot, get_settings
+
+
+def _engine_options(settings: SettingsSnapshot) -> Dict[str, Any]:
+    """Pool tuning for the async engine; SQLite's pools reject sizing options."""
+
+    options: Dict[str, Any] = {"pool_pre_ping": True, "pool_recycle": settings.db_pool_recycle}
+    if make_url(settings.database_url).get_backend_name() != "sqlite":
+        options.update(pool_size=settings.db_pool_size, max_overflow=settings.db_max_overflow)
+    return options
+
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON columns with orjson; non-str keys are stringified like ``json.dumps``."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 settings = get_settings()
-engine = create_async_engine(settings.database_url, echo=False, future=True)
-AsyncSessionLocal = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False, autoflush=False, autocommit=False
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    future=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **_engine_options(settings),
 )
+# Built once at import; every session checks connections out of the engine's shared pool.
+AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
 
 
 async def init_db() -> None:
@@ -24,20 +47,31 @@ async def init_db() -> None:
 
 
 @asynccontextmanager
-async def session_scope() -> AsyncSession:
-    """Async context manager that yields a session and handles cleanup."""
-    session: AsyncSession = AsyncSessionLocal()
-    try:
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """Async context manager that yields a session and commits on success."""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:  # pragma: no cover - defensive cleanup
+            await session.rollback()
+            raise
+
+
+@asynccontextmanager
+async def read_session_scope() -> AsyncIterator[AsyncSession]:
+    """Yield a session for read-only work; closing it releases the connection without a COMMIT."""
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency that yields a read-only AsyncSession."""
+    async with read_session_scope() as session:
         yield session
-        await session.commit()
-    except Exception:  # pragma: no cover - defensive cleanup
-        await session.rollback()
-        raise
-    finally:
-        await session.close()
 
 
-async def get_session() -> AsyncSession:
-    """FastAPI dependency that yields an AsyncSession."""
+async def get_write_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency that yields an AsyncSession committed after the handler."""
     async with session_scope() as session:
         yield session
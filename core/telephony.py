@@ -1,6 +1,7 @@
 """Telephony provider abstraction for the voice testing harness."""
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
@@ -31,6 +32,9 @@ class TelephonyProvider(ABC):
     async def parse_webhook_event(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize provider-specific webhook payloads into a common schema."""
 
+    def warmup(self) -> None:
+        """Pay one-time client setup costs ahead of the first call; a no-op by default."""
+
 
 class TwilioProvider(TelephonyProvider):
     """Concrete Twilio implementation using the Twilio REST API."""
@@ -40,6 +44,23 @@ class TwilioProvider(TelephonyProvider):
         self.account_sid = account_sid
         self.auth_token = auth_token
         self.default_from_number = default_from_number
+        self._client: Optional["Client"] = None
+
+    def _get_client(self) -> "Client":
+        # One REST client per provider so its HTTP session is reused across calls.
+        if self._client is None:
+            try:
+                from twilio.rest import Client  # type: ignore
+            except ImportError as exc:  # pragma: no cover
+                raise RuntimeError(
+                    "twilio is required for TwilioProvider. Install with `pip install twilio`."
+                ) from exc
+            self._client = Client(self.account_sid, self.auth_token)
+        return self._client
+
+    def warmup(self) -> None:
+        """Construct the REST client eagerly so the first call skips setup."""
+        self._get_client()
 
     async def initiate_call(
         self,
@@ -57,14 +78,9 @@ class TwilioProvider(TelephonyProvider):
             "test_case_id": test_case_id,
             "metadata": metadata or {},
         }
-        try:
-            from twilio.rest import Client  # type: ignore
-        except ImportError as exc:  # pragma: no cover
-            raise RuntimeError(
-                "twilio is required for TwilioProvider. Install with `pip install twilio`."
-            ) from exc
-        client = Client(self.account_sid, self.auth_token)
-        call = client.calls.create(
+        # The Twilio SDK does blocking HTTP; keep it off the event loop.
+        call = await asyncio.to_thread(
+            self._get_client().calls.create,
             to=to_number,
             from_=from_number,
             url=(metadata or {}).get("twiml_url"),
@@ -74,14 +90,7 @@ class TwilioProvider(TelephonyProvider):
         return payload
 
     async def hangup_call(self, call_id: str) -> Dict[str, Any]:
-        try:
-            from twilio.rest import Client  # type: ignore
-        except ImportError as exc:  # pragma: no cover
-            raise RuntimeError(
-                "twilio is required for TwilioProvider. Install with `pip install twilio`."
-            ) from exc
-        client = Client(self.account_sid, self.auth_token)
-        call = client.calls(call_id).update(status="completed")
+        call = await asyncio.to_thread(self._get_client().calls(call_id).update, status="completed")
         return {"provider": self.provider_name, "provider_call_id": call.sid, "status": call.status}
 
     async def parse_webhook_event(self, payload: Dict[str, Any]) -> Dict[str, Any]:
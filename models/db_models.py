@@ -1,16 +1,22 @@
 """SQLModel ORM models backing persistent test cases and runs."""
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, DateTime, Index, JSON
+from sqlalchemy.ext.mutable import MutableList
 from sqlmodel import Field, SQLModel
 
 from models.test_cases import TestCase, TurnExpectation
 
 
+def _utcnow() -> datetime:
+    """Timezone-aware UTC now; ``datetime.utcnow()`` is deprecated and returns naive values."""
+    return datetime.now(timezone.utc)
+
+
 class TestCaseRecord(SQLModel, table=True):
     """Stored deterministic test script definition."""
 
@@ -24,15 +30,16 @@ class TestCaseRecord(SQLModel, table=True):
 
     def to_domain(self) -> TestCase:
         """Convert ORM row to rich Pydantic model."""
-        turn_models = [TurnExpectation(**turn_data) for turn_data in self.turns]
-        return TestCase(test_id=self.test_id, persona=self.persona, turns=turn_models)
+        # Trusted input: rows are written from validated TestCase models, so skip re-validation.
+        turn_models = [TurnExpectation.construct(**turn_data) for turn_data in self.turns]
+        return TestCase.construct(test_id=self.test_id, persona=self.persona, turns=turn_models)
 
     @classmethod
     def from_domain(cls, test_case: TestCase) -> "TestCaseRecord":
         return cls(
             test_id=test_case.test_id,
             persona=test_case.persona,
-            turns=[turn.dict() for turn in test_case.turns],
+            turns=test_case.turn_payloads(),
         )
 
 
@@ -48,17 +55,32 @@ class TestRun(SQLModel, table=True):
     mode: str = Field(default="simulation")
     status: str = Field(default="pending")
     transcript: List[Dict[str, Any]] = Field(
-        default_factory=list, sa_column=Column(JSON, nullable=False)  # type: ignore[arg-type]
+        # MutableList flags the row dirty on in-place edits, so appends need not copy the list.
+        default_factory=list, sa_column=Column(MutableList.as_mutable(JSON), nullable=False)  # type: ignore[arg-type]
     )
     evaluation: Optional[Dict[str, Any]] = Field(
         default=None, sa_column=Column(JSON, nullable=True)  # type: ignore[arg-type]
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # create_all() leaves existing tables untouched; on Postgres, migrate older databases with
+    # ALTER COLUMN ... TYPE TIMESTAMP WITH TIME ZONE USING ... AT TIME ZONE 'UTC'.
+    created_at: datetime = Field(default_factory=_utcnow, sa_type=DateTime(timezone=True), nullable=False)
+    updated_at: datetime = Field(default_factory=_utcnow, sa_type=DateTime(timezone=True), nullable=False)
 
-    def append_transcript(self, new_rows: List[Dict[str, Any]]) -> None:
-        self.transcript = [*self.transcript, *new_rows]
+    def append_transcript(self, new_rows: List[Dict[str, Any]], max_rows: Optional[int] = None) -> int:
+        """Append rows, keeping only the newest ``max_rows``; return how many were dropped."""
+        self.transcript.extend(new_rows)
+        dropped = 0
+        if max_rows is not None and len(self.transcript) > max_rows:
+            dropped = len(self.transcript) - max_rows
+            del self.transcript[:dropped]
         self.touch()
+        return dropped
 
     def touch(self) -> None:
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _utcnow()
+
+
+# Matches the ORDER BY created_at DESC LIMIT n used to list recent runs.
+Index("ix_test_runs_created_at_desc", TestRun.created_at.desc())
+# Serves per-test-case run history: WHERE test_id = ? ORDER BY created_at DESC.
+Index("ix_test_runs_test_id_created_at", TestRun.test_id, TestRun.created_at.desc())
@@ -1,9 +1,9 @@
 """Pydantic data models for deterministic voice test cases."""
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 
 class TurnExpectation(BaseModel):
@@ -19,6 +19,11 @@ class TurnExpectation(BaseModel):
         description="Whether the agent response must match user_input exactly",
     )
 
+    _keyword_views: Optional[Tuple[List[str], FrozenSet[str], str]] = PrivateAttr(default=None)
+
+    class Config:
+        frozen = True
+
     @validator("expected_agent_response_keywords", each_item=True)
     def _strip_keywords(cls, keyword: str) -> str:  # noqa: D401
         """Ensure keywords are meaningful tokens."""
@@ -27,6 +32,26 @@ class TurnExpectation(BaseModel):
             raise ValueError("Keywords cannot be empty or whitespace")
         return cleaned
 
+    def _normalized_views(self) -> Tuple[List[str], FrozenSet[str], str]:
+        # Keyed on the list itself: copy(update=...) carries private attrs over.
+        keywords = self.expected_agent_response_keywords
+        if self._keyword_views is None or self._keyword_views[0] is not keywords:
+            self._keyword_views = (
+                keywords,
+                frozenset(keyword.lower() for keyword in keywords),
+                " ".join(" ".join(keywords).lower().split()),
+            )
+        return self._keyword_views
+
+    @property
+    def normalized_keywords(self) -> FrozenSet[str]:
+        """Lower-cased keywords, computed once per turn instead of on every validation call."""
+        return self._normalized_views()[1]
+
+    @property
+    def normalized_exact_phrase(self) -> str:
+        """Keywords joined and whitespace-normalized, as compared when ``exact_match_required``."""
+        return self._normalized_views()[2]
 
 class TestCase(BaseModel):
     """Ordered deterministic flow definition for a single test."""
@@ -35,14 +60,21 @@ class TestCase(BaseModel):
     persona: str = Field(..., description="Simulator persona name or description")
     turns: List[TurnExpectation] = Field(..., description="Ordered turn expectations")
 
+    class Config:
+        frozen = True
+
     @validator("turns")
     def _validate_turn_order(cls, turns: List[TurnExpectation]) -> List[TurnExpectation]:
         """Ensure steps are sequential without duplicates."""
         if not turns:
             raise ValueError("TestCase requires at least one turn expectation")
-        expected_order = 1
-        for turn in turns:
-            if turn.step_order != expected_order:
-                raise ValueError("turns must be sequential starting at 1")
-            expected_order += 1
+        if [turn.step_order for turn in turns] != list(range(1, len(turns) + 1)):
+            raise ValueError("turns must be sequential starting at 1")
         return turns
+
+    def turn_payloads(self) -> List[Dict[str, Any]]:
+        """Plain-dict turns for JSON storage, copied without ``.dict()`` field reflection."""
+        return [
+            {**turn.__dict__, "expected_agent_response_keywords": list(turn.expected_agent_response_keywords)}
+            for turn in self.turns
+        ]
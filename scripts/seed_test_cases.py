@@ -2,81 +2,141 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List
+import logging
+from contextlib import nullcontext
+from functools import cache
+from typing import Any, List, Optional
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from core.database import init_db, session_scope
 from models.db_models import TestCaseRecord
 from models.test_cases import TestCase, TurnExpectation
 
 
-SAMPLE_TEST_CASES: List[TestCase] = [
-    TestCase(
-        test_id="billing_inquiry_v1",
-        persona="Calm Customer",
-        turns=[
-            TurnExpectation(
-                step_order=1,
-                user_input="Hi, I noticed my bill jumped this month.",
-                expected_agent_response_keywords=["account", "review", "details"],
-                exact_match_required=False,
-            ),
-            TurnExpectation(
-                step_order=2,
-                user_input="Can you explain the extra charges?",
-                expected_agent_response_keywords=["overage", "usage", "explain"],
-                exact_match_required=False,
-            ),
-            TurnExpectation(
-                step_order=3,
-                user_input="Thanks, what are my options to lower it?",
-                expected_agent_response_keywords=["discount", "plan", "offer"],
-                exact_match_required=False,
-            ),
-        ],
-    ),
-    TestCase(
-        test_id="appointment_booking_v1",
-        persona="Impatient Caller",
-        turns=[
-            TurnExpectation(
-                step_order=1,
-                user_input="I need to schedule a service visit.",
-                expected_agent_response_keywords=["availability", "date"],
-                exact_match_required=False,
-            ),
-            TurnExpectation(
-                step_order=2,
-                user_input="Morning slots only, please.",
-                expected_agent_response_keywords=["morning", "confirm"],
-                exact_match_required=False,
-            ),
-            TurnExpectation(
-                step_order=3,
-                user_input="Send me a confirmation text.",
-                expected_agent_response_keywords=["text", "confirmation"],
-                exact_match_required=False,
-            ),
-        ],
-    ),
-]
-
-
-async def upsert_test_case(test_case: TestCase) -> None:
-    async with session_scope() as session:
-        existing = await session.get(TestCaseRecord, test_case.test_id)
-        if existing:
-            existing.persona = test_case.persona
-            existing.turns = [turn.dict() for turn in test_case.turns]
-        else:
-            session.add(TestCaseRecord.from_domain(test_case))
+logger = logging.getLogger(__name__)
+
+
+@cache
+def sample_test_cases() -> List[TestCase]:
+    """Build (and validate) the sample scripts on first use rather than at import."""
+    return [
+        TestCase(
+            test_id="billing_inquiry_v1",
+            persona="Calm Customer",
+            turns=[
+                TurnExpectation(
+                    step_order=1,
+                    user_input="Hi, I noticed my bill jumped this month.",
+                    expected_agent_response_keywords=["account", "review", "details"],
+                    exact_match_required=False,
+                ),
+                TurnExpectation(
+                    step_order=2,
+                    user_input="Can you explain the extra charges?",
+                    expected_agent_response_keywords=["overage", "usage", "explain"],
+                    exact_match_required=False,
+                ),
+                TurnExpectation(
+                    step_order=3,
+                    user_input="Thanks, what are my options to lower it?",
+                    expected_agent_response_keywords=["discount", "plan", "offer"],
+                    exact_match_required=False,
+                ),
+            ],
+        ),
+        TestCase(
+            test_id="appointment_booking_v1",
+            persona="Impatient Caller",
+            turns=[
+                TurnExpectation(
+                    step_order=1,
+                    user_input="I need to schedule a service visit.",
+                    expected_agent_response_keywords=["availability", "date"],
+                    exact_match_required=False,
+                ),
+                TurnExpectation(
+                    step_order=2,
+                    user_input="Morning slots only, please.",
+                    expected_agent_response_keywords=["morning", "confirm"],
+                    exact_match_required=False,
+                ),
+                TurnExpectation(
+                    step_order=3,
+                    user_input="Send me a confirmation text.",
+                    expected_agent_response_keywords=["text", "confirmation"],
+                    exact_match_required=False,
+                ),
+            ],
+        ),
+    ]
+
+
+def _native_upsert(dialect_name: str, test_cases: List[TestCase]) -> Optional[Any]:
+    """Build one multi-row INSERT ... ON CONFLICT DO UPDATE where the dialect supports it."""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    statement = insert(TestCaseRecord).values(
+        [
+            {
+                "test_id": test_case.test_id,
+                "persona": test_case.persona,
+                "turns": test_case.turn_payloads(),
+            }
+            for test_case in test_cases
+        ]
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[TestCaseRecord.test_id],
+        set_={"persona": statement.excluded.persona, "turns": statement.excluded.turns},
+    )
+
+
+async def upsert_test_cases(test_cases: List[TestCase], *, session: Optional[AsyncSession] = None) -> None:
+    """Insert or update every test case inside a single transaction.
+
+    Pass ``session`` to join a caller's unit of work; the caller then owns the commit.
+    """
+    if not test_cases:
+        return
+    scope = nullcontext(session) if session is not None else session_scope()
+    async with scope as session:
+        statement = _native_upsert(session.get_bind().dialect.name, test_cases)
+        if statement is not None:
+            await session.exec(statement)
+            return
+        # Generic fallback: one IN lookup for the whole batch instead of a get() per case.
+        result = await session.exec(
+            select(TestCaseRecord).where(
+                TestCaseRecord.test_id.in_([test_case.test_id for test_case in test_cases])  # type: ignore[attr-defined]
+            )
+        )
+        existing = {record.test_id: record for record in result.all()}
+        for test_case in test_cases:
+            record = existing.get(test_case.test_id)
+            if record:
+                record.persona = test_case.persona
+                record.turns = test_case.turn_payloads()
+            else:
+                session.add(TestCaseRecord.from_domain(test_case))
+
+
+async def upsert_test_case(test_case: TestCase, *, session: Optional[AsyncSession] = None) -> None:
+    await upsert_test_cases([test_case], session=session)
 
 
 async def main() -> None:
     await init_db()
-    for case in SAMPLE_TEST_CASES:
-        await upsert_test_case(case)
-    print(f"Seeded {len(SAMPLE_TEST_CASES)} test cases.")
+    test_cases = sample_test_cases()
+    await upsert_test_cases(test_cases)
+    logger.info("Seeded %d test cases.", len(test_cases))
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
@@ -1,9 +1,11 @@
 """HTTP client helpers for interacting with the FastAPI service."""
 from __future__ import annotations
 
+import weakref
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 
 
 class VoiceFrameworkClient:
@@ -20,6 +22,15 @@ class VoiceFrameworkClient:
         self.timeout = timeout
         self.api_key = api_key
         self.api_key_header_name = api_key_header_name
+        # Long-lived client so consecutive calls reuse keep-alive connections instead of reconnecting.
+        self._http = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers=self._auth_headers(),
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+        )
+        # Closes the pool once the client is garbage collected (e.g. evicted from a cache) or at exit.
+        self._finalizer = weakref.finalize(self, self._http.close)
 
     def _auth_headers(self) -> Dict[str, str]:
         if not self.api_key:
@@ -27,23 +38,37 @@ class VoiceFrameworkClient:
         return {self.api_key_header_name: self.api_key}
 
     def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
-        url = f"{self.base_url}{path}"
-        headers = {**self._auth_headers(), **kwargs.pop("headers", {})}
-        response = httpx.request(method, url, timeout=self.timeout, headers=headers, **kwargs)
+        response = self._http.request(method, path, **kwargs)
         response.raise_for_status()
         return response
 
+    def warmup(self) -> None:
+        """Open a pooled connection (TCP/TLS) ahead of the first real request; failures are ignored."""
+        try:
+            self._http.get("/health")
+        except httpx.HTTPError:
+            pass
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def __enter__(self) -> "VoiceFrameworkClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def list_test_cases(self) -> List[Dict[str, Any]]:
         response = self._request("GET", "/testcases")
-        return response.json()
+        return orjson.loads(response.content)
 
     def list_test_runs(self, limit: int = 10) -> List[Dict[str, Any]]:
         response = self._request("GET", "/testruns", params={"limit": limit})
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_test_run(self, run_id: str) -> Dict[str, Any]:
         response = self._request("GET", f"/testruns/{run_id}")
-        return response.json()
+        return orjson.loads(response.content)
 
     def run_test_case(
         self,
@@ -66,5 +91,4 @@ class VoiceFrameworkClient:
         if from_number:
             payload["from_number"] = from_number
         response = self._request("POST", "/test/run", json=payload)
-        return response.json()
-*** End Patch
\ No newline at end of file
+        return orjson.loads(response.content)
@@ -1,9 +1,16 @@
 """LLM utilities and clients for simulator/evaluator orchestration."""
 from __future__ import annotations
 
-from typing import Any, Optional, Protocol
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Protocol, Tuple
 
-from core.config import Settings
+import httpx
+
+from core.config import SettingsSnapshot
 
 
 class LLMClientProtocol(Protocol):
@@ -18,6 +25,21 @@ class NoopLLMClient:
         return prompt
 
 
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.AsyncClient:
+    """One pooled transport for every SDK client so keep-alive connections are reused across calls."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+    )
+
+
+async def _close_shared_http_client() -> None:
+    if _shared_http_client.cache_info().currsize:
+        client = _shared_http_client()
+        _shared_http_client.cache_clear()
+        await client.aclose()
+
+
 class OpenAIChatClient:
     """Thin wrapper around the async OpenAI Chat Completions API."""
 
@@ -35,9 +57,18 @@ class OpenAIChatClient:
                 raise RuntimeError(
                     "openai package is required. Install via `pip install openai`."
                 ) from exc
-            self._client = AsyncOpenAI(api_key=self.api_key)
+            self._client = AsyncOpenAI(api_key=self.api_key, http_client=_shared_http_client())
         return self._client
 
+    async def warmup(self) -> None:
+        """Construct the SDK client eagerly so the first generate() skips setup."""
+        await self._get_client()
+
+    async def aclose(self) -> None:
+        """Drop the SDK client and close the shared connection pool."""
+        self._client = None
+        await _close_shared_http_client()
+
     async def generate(self, prompt: str, **kwargs: Any) -> str:
         client = await self._get_client()
         response = await client.chat.completions.create(
@@ -66,9 +97,18 @@ class AnthropicMessagesClient:
                 raise RuntimeError(
                     "anthropic package is required. Install via `pip install anthropic`."
                 ) from exc
-            self._client = AsyncAnthropic(api_key=self.api_key)
+            self._client = AsyncAnthropic(api_key=self.api_key, http_client=_shared_http_client())
         return self._client
 
+    async def warmup(self) -> None:
+        """Construct the SDK client eagerly so the first generate() skips setup."""
+        await self._get_client()
+
+    async def aclose(self) -> None:
+        """Drop the SDK client and close the shared connection pool."""
+        self._client = None
+        await _close_shared_http_client()
+
     async def generate(self, prompt: str, **kwargs: Any) -> str:
         client = await self._get_client()
         response = await client.messages.create(
@@ -84,19 +124,85 @@ class AnthropicMessagesClient:
         return " ".join(chunks).strip()
 
 
-def build_llm_client(settings: Settings) -> LLMClientProtocol:
+class CachedLLMClient:
+    """Exact-match LRU cache in front of a provider client for deterministic (temperature 0) prompts."""
+
+    def __init__(self, inner: LLMClientProtocol, max_entries: int = 4096, ttl_seconds: float = 3600.0) -> None:
+        self.inner = inner
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def _cache_key(self, prompt: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        temperature = kwargs.get("temperature", getattr(self.inner, "temperature", 0.0))
+        if temperature:
+            # Sampled completions are expected to vary between calls; never pin one.
+            return None
+        payload = json.dumps(
+            {"model": getattr(self.inner, "model", None), "prompt": prompt, "kwargs": kwargs},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def generate(self, prompt: str, **kwargs: Any) -> str:
+        key = self._cache_key(prompt, kwargs)
+        if key is None:
+            return await self.inner.generate(prompt, **kwargs)
+
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+        self.stats["misses"] += 1
+        response = await self.inner.generate(prompt, **kwargs)
+        self._entries[key] = (now + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return response
+
+    async def warmup(self) -> None:
+        warmup = getattr(self.inner, "warmup", None)
+        if warmup is not None:
+            await warmup()
+
+    async def aclose(self) -> None:
+        self._entries.clear()
+        aclose = getattr(self.inner, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _with_cache(client: LLMClientProtocol, settings: SettingsSnapshot) -> LLMClientProtocol:
+    if settings.llm_cache_size <= 0:
+        return client
+    return CachedLLMClient(client, max_entries=settings.llm_cache_size, ttl_seconds=settings.llm_cache_ttl)
+
+
+def build_llm_client(settings: SettingsSnapshot) -> LLMClientProtocol:
     """Return the most capable configured LLM client, defaulting to noop."""
 
     if settings.openai_api_key:
-        return OpenAIChatClient(
-            api_key=settings.openai_api_key,
-            model=settings.openai_model,
-            temperature=settings.llm_temperature,
+        return _with_cache(
+            OpenAIChatClient(
+                api_key=settings.openai_api_key,
+                model=settings.openai_model,
+                temperature=settings.llm_temperature,
+            ),
+            settings,
         )
     if settings.anthropic_api_key:
-        return AnthropicMessagesClient(
-            api_key=settings.anthropic_api_key,
-            model=settings.anthropic_model,
-            temperature=settings.llm_temperature,
+        return _with_cache(
+            AnthropicMessagesClient(
+                api_key=settings.anthropic_api_key,
+                model=settings.anthropic_model,
+                temperature=settings.llm_temperature,
+            ),
+            settings,
         )
     return NoopLLMClient()
@@ -1,15 +1,20 @@
 """Simulator agent that roleplays the customer using deterministic scripts."""
 from __future__ import annotations
 
+import asyncio
 import random
 from typing import Any, Dict, List, Optional, Protocol
 
+import orjson
+
 from models.test_cases import TestCase, TurnExpectation
 from services.llm import LLMClientProtocol, NoopLLMClient
 
 
 TranscriptRow = Dict[str, Any]
 
+_FILLERS = ("um", "uh", "you know", "I mean", "like")
+
 
 class AgentResponderProtocol(Protocol):
     async def respond(self, user_text: str, turn: TurnExpectation) -> str:
@@ -26,25 +31,50 @@ class DeterministicAgentResponder:
 class SimulatorAgent:
     """Walk a TestCase turn-by-turn and collect a transcript."""
 
+    # Prompt text lives in one place; each call only fills the placeholders.
+    _NATURALIZE_TEMPLATE = (
+        "You are role-playing a caller in a QA test. "
+        "Adopt the persona '{persona}'. "
+        "Restate the following line in your own words while preserving intent: "
+        "'{user_input}'. Keep it under 20 words."
+    )
+    _BATCH_NATURALIZE_TEMPLATE = (
+        "You are role-playing a caller in a QA test. "
+        "Adopt the persona '{persona}'. "
+        "Restate each of the following lines in your own words while preserving intent, "
+        "keeping each under 20 words. Respond with only a JSON array of strings, one per line, "
+        "in the same order: {lines}"
+    )
+    _STEER_TEMPLATE = (
+        "You are a QA caller ensuring the agent follows the script. "
+        "Stay in persona '{persona}'. "
+        "Craft a short sentence that politely redirects the agent toward: "
+        "'{user_input}'. The agent previously responded with: "
+        "'{agent_response}'."
+    )
+
     def __init__(
         self,
         llm_client: Optional[LLMClientProtocol] = None,
         agent_responder: Optional[AgentResponderProtocol] = None,
         naturalize_user_prompts: bool = False,
         disfluency_rate: float = 0.0,
+        seed: Optional[int] = None,
     ) -> None:
         self.llm_client = llm_client or NoopLLMClient()
         self.agent_responder = agent_responder or DeterministicAgentResponder()
         self.naturalize_user_prompts = naturalize_user_prompts
         self.disfluency_rate = max(0.0, min(disfluency_rate, 1.0))
+        # Private RNG: no contention on the global one, and runs are reproducible when seeded.
+        self._rng = random.Random(seed)
 
     async def run(self, test_case: TestCase) -> List[TranscriptRow]:
         transcript: List[TranscriptRow] = []
         needs_steer = False
         last_agent_response: Optional[str] = None
 
-        for turn in test_case.turns:
-            user_text = await self._render_user_prompt(test_case, turn)
+        rendered_prompts = await self._render_user_prompts(test_case)
+        for turn, user_text in zip(test_case.turns, rendered_prompts):
             if needs_steer:
                 user_text = await self._generate_steer_text(test_case, turn, last_agent_response)
             user_text = self._inject_disfluencies(user_text)
@@ -63,26 +93,55 @@ class SimulatorAgent:
                     "step_order": turn.step_order,
                 }
             )
-            needs_steer = not self._agent_matched_expectation(
-                agent_response,
-                turn.expected_agent_response_keywords,
-                turn.exact_match_required,
-            )
+            needs_steer = not self._agent_matched_expectation(agent_response, turn)
             last_agent_response = agent_response
 
         return transcript
 
+    async def _render_user_prompts(self, test_case: TestCase) -> List[str]:
+        """Naturalize every scripted line up front; only steering depends on earlier replies."""
+
+        if not self.naturalize_user_prompts or isinstance(self.llm_client, NoopLLMClient):
+            return [turn.user_input for turn in test_case.turns]
+        if len(test_case.turns) > 1:
+            batched = await self._batch_naturalize(test_case)
+            if batched is not None:
+                return batched
+        return list(
+            await asyncio.gather(*(self._render_user_prompt(test_case, turn) for turn in test_case.turns))
+        )
+
+    async def _batch_naturalize(self, test_case: TestCase) -> Optional[List[str]]:
+        """Restate all lines in one LLM request; ``None`` when the reply is not a usable JSON array."""
+
+        lines = [turn.user_input for turn in test_case.turns]
+        prompt = self._BATCH_NATURALIZE_TEMPLATE.format_map(
+            {"persona": test_case.persona, "lines": orjson.dumps(lines).decode()}
+        )
+        candidate = await self.llm_client.generate(prompt)
+        # Models often wrap JSON in prose or code fences; parse just the outermost array.
+        start, end = candidate.find("["), candidate.rfind("]")
+        if start == -1 or end <= start:
+            return None
+        try:
+            restated = orjson.loads(candidate[start : end + 1])
+        except orjson.JSONDecodeError:
+            return None
+        if not isinstance(restated, list) or len(restated) != len(lines):
+            return None
+        return [
+            item.strip() if isinstance(item, str) and item.strip() else line
+            for item, line in zip(restated, lines)
+        ]
+
     async def _render_user_prompt(self, test_case: TestCase, turn: TurnExpectation) -> str:
         """Optionally let the LLM naturalize the scripted line."""
 
         if not self.naturalize_user_prompts or isinstance(self.llm_client, NoopLLMClient):
             return turn.user_input
 
-        prompt = (
-            "You are role-playing a caller in a QA test. "
-            f"Adopt the persona '{test_case.persona}'. "
-            "Restate the following line in your own words while preserving intent: "
-            f"'{turn.user_input}'. Keep it under 20 words."
+        prompt = self._NATURALIZE_TEMPLATE.format_map(
+            {"persona": test_case.persona, "user_input": turn.user_input}
         )
         candidate = await self.llm_client.generate(prompt)
         return candidate or turn.user_input
@@ -95,38 +154,35 @@ class SimulatorAgent:
     ) -> str:
         """Use the LLM to nudge the agent back to the scripted step."""
 
-        steer_prompt = (
-            "You are a QA caller ensuring the agent follows the script. "
-            f"Stay in persona '{test_case.persona}'. "
-            "Craft a short sentence that politely redirects the agent toward: "
-            f"'{turn.user_input}'. The agent previously responded with: "
-            f"'{agent_response or 'NO RESPONSE'}'."
+        steer_prompt = self._STEER_TEMPLATE.format_map(
+            {
+                "persona": test_case.persona,
+                "user_input": turn.user_input,
+                "agent_response": agent_response or "NO RESPONSE",
+            }
         )
         return await self.llm_client.generate(steer_prompt)
 
     def _inject_disfluencies(self, text: str) -> str:
         """Optionally add filler words to mimic more natural callers."""
 
-        if not self.disfluency_rate or not text.strip():
+        if not self.disfluency_rate or self._rng.random() > self.disfluency_rate:
             return text
-        if random.random() > self.disfluency_rate:
+        words = text.split()
+        if not words:
             return text
 
-        fillers = ["um", "uh", "you know", "I mean", "like"]
-        words = text.split()
-        insert_at = random.randint(0, len(words)) if words else 0
-        filler = random.choice(fillers)
-        words.insert(insert_at, filler)
+        words.insert(self._rng.randint(0, len(words)), self._rng.choice(_FILLERS))
         return " ".join(words)
 
     @staticmethod
-    def _agent_matched_expectation(
-        agent_text: str,
-        keywords: List[str],
-        exact_match: bool,
-    ) -> bool:
+    def _agent_matched_expectation(agent_text: str, turn: TurnExpectation) -> bool:
+        if not turn.exact_match_required and len(turn.normalized_keywords) == 1:
+            (keyword,) = turn.normalized_keywords
+            # Collapsing whitespace cannot change where a whitespace-free keyword matches.
+            if len(keyword.split()) == 1:
+                return keyword in agent_text.lower()
         normalized = " ".join(agent_text.lower().strip().split())
-        if exact_match:
-            target = " ".join(keyword.lower().strip() for keyword in keywords)
-            return normalized == target
-        return all(keyword.lower() in normalized for keyword in keywords)
+        if turn.exact_match_required:
+            return normalized == turn.normalized_exact_phrase
+        return all(keyword in normalized for keyword in turn.normalized_keywords)
@@ -1,33 +1,74 @@
 """Turn-by-turn validation utilities for deterministic transcripts."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Sequence, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Sequence, Tuple
 
 from models.test_cases import TestCase, TurnExpectation
 
+try:
+    import ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator
+    ahocorasick = None
+
 
 TranscriptRow = Dict[str, Any]
 
+# Below this many keywords, a few C-level substring scans beat walking an automaton.
+_AUTOMATON_MIN_KEYWORDS = 8
+
 
+@lru_cache(maxsize=2048)
 def _normalize(text: str) -> str:
+    # Memoized: re-validating a transcript (or a repeated agent line) reuses the normalized form.
     return " ".join(text.lower().strip().split())
 
 
-def _contains_keywords(text: str, keywords: List[str]) -> bool:
+@lru_cache(maxsize=1024)
+def _keyword_automaton(keywords: FrozenSet[str]) -> Any:
+    automaton = ahocorasick.Automaton()
+    for index, keyword in enumerate(keywords):
+        automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+
+def _contains_keywords(text: str, keywords: FrozenSet[str]) -> bool:
+    """Check pre-lowered ``keywords`` against the normalized text."""
     normalized = _normalize(text)
-    return all(keyword.lower() in normalized for keyword in keywords)
+    if ahocorasick is None or len(keywords) < _AUTOMATON_MIN_KEYWORDS:
+        return all(keyword in normalized for keyword in keywords)
+    # One pass over the text; each bit records a keyword seen at least once.
+    expected = (1 << len(keywords)) - 1
+    seen = 0
+    for _end, index in _keyword_automaton(keywords).iter(normalized):
+        seen |= 1 << index
+        if seen == expected:
+            return True
+    return False
+
+
+def _speaker_positions(transcript: Sequence[TranscriptRow]) -> Dict[Any, List[int]]:
+    """Ascending row indices per speaker, built in one pass over the transcript."""
+    positions: Dict[Any, List[int]] = {}
+    for idx, row in enumerate(transcript):
+        positions.setdefault(row.get("speaker"), []).append(idx)
+    return positions
 
 
 def _find_next_speaker(
     transcript: Sequence[TranscriptRow],
+    positions: Dict[Any, List[int]],
     start_index: int,
     speaker: str,
 ) -> Tuple[int, TranscriptRow]:
-    for idx in range(start_index + 1, len(transcript)):
-        row = transcript[idx]
-        if row.get("speaker") == speaker:
-            return idx, row
-    raise ValueError(f"Transcript missing speaker '{speaker}' after index {start_index}")
+    indices = positions.get(speaker, [])
+    slot = bisect_right(indices, start_index)
+    if slot == len(indices):
+        raise ValueError(f"Transcript missing speaker '{speaker}' after index {start_index}")
+    idx = indices[slot]
+    return idx, transcript[idx]
 
 
 def validate_turn_by_turn(
@@ -38,14 +79,19 @@ def validate_turn_by_turn(
 
     report_steps: List[Dict[str, Any]] = []
     failures: List[str] = []
+    # Metrics are tallied as steps are recorded rather than by re-walking report_steps.
+    failure_steps: List[int] = []
+    user_deviation_detected = False
+    positions = _speaker_positions(transcript)
     cursor = -1
 
     for expectation in test_case.turns:
         try:
-            user_idx, user_row = _find_next_speaker(transcript, cursor, speaker="user")
+            user_idx, user_row = _find_next_speaker(transcript, positions, cursor, speaker="user")
         except ValueError as err:
             failure = f"Step {expectation.step_order} Failed: Missing user input in transcript"
             failures.append(failure)
+            failure_steps.append(expectation.step_order)
             report_steps.append(
                 {
                     "step_order": expectation.step_order,
@@ -63,10 +109,11 @@ def validate_turn_by_turn(
         user_match = expectation.user_input.lower() in _normalize(actual_user_text)
 
         try:
-            agent_idx, agent_row = _find_next_speaker(transcript, cursor, speaker="agent")
+            agent_idx, agent_row = _find_next_speaker(transcript, positions, cursor, speaker="agent")
         except ValueError as err:
             failure = f"Step {expectation.step_order} Failed: Agent never responded"
             failures.append(failure)
+            failure_steps.append(expectation.step_order)
             report_steps.append(
                 {
                     "step_order": expectation.step_order,
@@ -82,16 +129,16 @@ def validate_turn_by_turn(
         cursor = agent_idx
         agent_text = agent_row.get("text", "")
         if expectation.exact_match_required:
-            expected_phrase = " ".join(expectation.expected_agent_response_keywords)
-            agent_pass = _normalize(agent_text) == _normalize(expected_phrase)
+            agent_pass = _normalize(agent_text) == expectation.normalized_exact_phrase
         else:
-            agent_pass = _contains_keywords(agent_text, expectation.expected_agent_response_keywords)
+            agent_pass = _contains_keywords(agent_text, expectation.normalized_keywords)
 
         step_pass = agent_pass and user_match
         if not step_pass:
             failure_reason = []
             if not user_match:
                 failure_reason.append("User deviation detected")
+                user_deviation_detected = True
             if not agent_pass:
                 failure_reason.append(
                     "Missing keywords" if not expectation.exact_match_required else "Exact match failed"
@@ -101,6 +148,7 @@ def validate_turn_by_turn(
                 f"got '{agent_text or 'NO_RESPONSE'}'"
             )
             failures.append(failure_message)
+            failure_steps.append(expectation.step_order)
         else:
             failure_reason = []
 
@@ -118,14 +166,10 @@ def validate_turn_by_turn(
         )
 
     total_steps = len(report_steps)
-    steps_passed = sum(1 for step in report_steps if step.get("passed"))
-    failure_steps = [step["step_order"] for step in report_steps if not step.get("passed")]
-    user_deviation_detected = any(
-        step.get("details") and "User deviation" in step["details"] for step in report_steps
-    )
+    steps_passed = total_steps - len(failure_steps)
 
     return {
-        "overall_passed": not failures and all(step["passed"] for step in report_steps),
+        "overall_passed": not failures,
         "failures": failures,
         "steps": report_steps,
         "metrics": {
@@ -1,18 +1,23 @@
 """Streamlit dashboard for orchestrating deterministic voice QA runs."""
 from __future__ import annotations
 
-import json
 import os
+import threading
+from html import escape
 from typing import Any, Dict, List
 
+import orjson
+import pandas as pd
 import streamlit as st
 from httpx import HTTPError
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from services.api_client import VoiceFrameworkClient
 
 DEFAULT_API_BASE_URL = os.getenv("VOICE_API_BASE_URL", "http://localhost:8000")
 DEFAULT_API_KEY = os.getenv("VOICE_API_KEY", "")
 DEFAULT_API_KEY_HEADER = os.getenv("VOICE_API_KEY_HEADER", "x-api-key")
+RECENT_RUNS_LIMIT = 5
 
 st.set_page_config(page_title="Voice Agent QA Deck", page_icon="🎙️", layout="wide")
 
@@ -41,20 +46,47 @@ st.markdown(
         font-weight: 600;
         color: #7EF5C4;
     }
+    .zipper-step {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 0.25rem 1.5rem;
+        margin-bottom: 0.75rem;
+    }
+    .zipper-step-title {
+        grid-column: 1 / -1;
+        font-weight: 600;
+    }
+    .zipper-warning {
+        margin: 0.25rem 0 0.75rem;
+        padding: 0.5rem 0.75rem;
+        border-radius: 8px;
+        background: rgba(255, 196, 0, 0.15);
+    }
     </style>
     """,
     unsafe_allow_html=True,
 )
 
 
-@st.cache_data(ttl=30)
-def load_test_cases(base_url: str, api_key: str, api_key_header: str) -> List[Dict[str, Any]]:
+@st.cache_resource(max_entries=4)
+def get_client(base_url: str, api_key: str, api_key_header: str) -> VoiceFrameworkClient:
+    """One pooled API client per connection settings, shared across reruns and sessions.
+
+    Only a few settings combinations stay cached; an evicted client closes its pool when collected.
+    """
     client = VoiceFrameworkClient(
         base_url,
         api_key=api_key or None,
-        api_key_header_name=api_key_header,
+        api_key_header_name=api_key_header or "x-api-key",
     )
-    return client.list_test_cases()
+    # Connect in the background so the first click does not pay connection setup.
+    threading.Thread(target=client.warmup, name="voice-api-warmup", daemon=True).start()
+    return client
+
+
+@st.cache_data(ttl=30)
+def load_test_cases(base_url: str, api_key: str, api_key_header: str) -> List[Dict[str, Any]]:
+    return get_client(base_url, api_key, api_key_header).list_test_cases()
 
 
 @st.cache_data(ttl=15)
@@ -64,29 +96,99 @@ def load_recent_runs(
     api_key_header: str,
     limit: int,
 ) -> List[Dict[str, Any]]:
-    client = VoiceFrameworkClient(
-        base_url,
-        api_key=api_key or None,
-        api_key_header_name=api_key_header,
+    return get_client(base_url, api_key, api_key_header).list_test_runs(limit=limit)
+
+
+def load_catalog(base_url: str, api_key: str, api_key_header: str) -> List[Dict[str, Any]]:
+    """Load test cases while the recent-runs cache fills on a second thread; returns the test cases."""
+    ctx = get_script_run_ctx()
+
+    def _prefetch_recent_runs() -> None:
+        add_script_run_ctx(threading.current_thread(), ctx)
+        try:
+            load_recent_runs(base_url, api_key, api_key_header, limit=RECENT_RUNS_LIMIT)
+        except HTTPError:
+            pass  # Not cached on failure; the Recent Runs section retries and reports it.
+
+    prefetch = threading.Thread(target=_prefetch_recent_runs, name="voice-runs-prefetch", daemon=True)
+    prefetch.start()
+    try:
+        return load_test_cases(base_url, api_key, api_key_header)
+    finally:
+        prefetch.join()
+
+
+@st.cache_data(max_entries=256)
+def build_turn_frame(turns: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Script blueprint table for a test case, rebuilt only when its turns change."""
+    return pd.DataFrame.from_records(
+        [
+            (
+                turn["step_order"],
+                turn["user_input"],
+                ", ".join(turn["expected_agent_response_keywords"]),
+                "Yes" if turn["exact_match_required"] else "No",
+            )
+            for turn in turns
+        ],
+        columns=["Step", "User Prompt", "Keywords", "Exact?"],
+    )
+
+
+@st.cache_data(max_entries=1024)
+def render_step_html(step: Dict[str, Any], with_title: bool = False) -> str:
+    """Two-column HTML for one zipper step, memoized so reruns skip rebuilding it."""
+    title = (
+        f"<div class='zipper-step-title'>Step {escape(str(step.get('step_order')))}</div>" if with_title else ""
+    )
+    keywords = ", ".join(step.get("expected_keywords", []))
+    return (
+        f"<div class='zipper-step'>{title}"
+        f"<div><b>Expected user:</b> {escape(str(step.get('expected_user_input') or '—'))}</div>"
+        f"<div><b>Agent response:</b> {escape(str(step.get('agent_response') or '—'))}</div>"
+        f"<div><b>Actual user:</b> {escape(str(step.get('actual_user_input') or '—'))}</div>"
+        f"<div><b>Keywords:</b> {escape(keywords)}</div>"
+        "</div>"
     )
-    return client.list_test_runs(limit=limit)
+
+
+# Up to this many failures keep native expanders and warnings; beyond it everything is static HTML.
+NATIVE_FAILURE_LIMIT = 10
+
+
+@st.cache_data(max_entries=256)
+def render_steps_html(steps: List[Dict[str, Any]], include_failures: bool) -> str:
+    """All passed steps (and optionally failures) as <details> blocks, for a single markdown delta."""
+    passed_steps = [step for step in steps if step.get("passed")]
+    parts = []
+    if passed_steps:
+        parts.append(f"<details><summary>✅ {len(passed_steps)} passed steps</summary>")
+        parts.extend(render_step_html(step, with_title=True) for step in passed_steps)
+        parts.append("</details>")
+    if include_failures:
+        for step in steps:
+            if step.get("passed"):
+                continue
+            parts.append(
+                f"<details open><summary>Step {escape(str(step.get('step_order')))}: ❌</summary>"
+                f"{render_step_html(step)}"
+                f"<div class='zipper-warning'>{escape(step.get('details') or 'Validation failed.')}</div>"
+                "</details>"
+            )
+    return "".join(parts)
 
 
 def render_zipper_report(report: Dict[str, Any]) -> None:
     steps = report.get("steps", [])
-    for step in steps:
-        status_icon = "✅" if step.get("passed") else "❌"
-        with st.expander(f"Step {step.get('step_order')}: {status_icon}", expanded=not step.get("passed")):
-            cols = st.columns(2)
-            cols[0].markdown(f"**Expected user:** {step.get('expected_user_input')}")
-            cols[0].markdown(f"**Actual user:** {step.get('actual_user_input') or '—'}")
-            cols[1].markdown(
-                f"**Agent response:** {step.get('agent_response') or '—'}"
-            )
-            cols[1].markdown(
-                f"**Keywords:** {', '.join(step.get('expected_keywords', []))}"
-            )
-            if not step.get("passed"):
+    failed_steps = [step for step in steps if not step.get("passed")]
+    native_failures = len(failed_steps) < NATIVE_FAILURE_LIMIT
+    html = render_steps_html(steps, include_failures=not native_failures)
+    if html:
+        st.markdown(html, unsafe_allow_html=True)
+    if native_failures:
+        for step in failed_steps:
+            with st.expander(f"Step {step.get('step_order')}: ❌", expanded=True):
+                st.markdown(render_step_html(step), unsafe_allow_html=True)
                 st.warning(step.get("details") or "Validation failed.")
 
 
@@ -103,17 +205,13 @@ with st.sidebar:
 
 st.title("Voice Agent QA Deck")
 
-client = VoiceFrameworkClient(
-    base_url,
-    api_key=api_key or None,
-    api_key_header_name=api_key_header or "x-api-key",
-)
+client = get_client(base_url, api_key, api_key_header)
 
 try:
     if refresh_trigger:
         load_test_cases.clear()
         load_recent_runs.clear()
-    test_cases = load_test_cases(base_url, api_key, api_key_header)
+    test_cases = load_catalog(base_url, api_key, api_key_header)
 except HTTPError as exc:
     st.error(f"Failed to load test cases: {exc}")
     st.stop()
@@ -122,24 +220,17 @@ if not test_cases:
     st.info("No test cases found. Run `python scripts/seed_test_cases.py` first.")
     st.stop()
 
+# Indexed once so option labels and the selected case are O(1) lookups.
+test_cases_by_id = {case["test_id"]: case for case in test_cases}
 selected_case = st.selectbox(
     "Select Test Case",
-    options=[case["test_id"] for case in test_cases],
-    format_func=lambda tid: next(case["persona"] for case in test_cases if case["test_id"] == tid),
+    options=list(test_cases_by_id),
+    format_func=lambda tid: test_cases_by_id[tid]["persona"],
 )
-current_case = next(case for case in test_cases if case["test_id"] == selected_case)
+current_case = test_cases_by_id[selected_case]
 
 st.subheader("Script Blueprint")
-turn_rows = [
-    {
-        "Step": turn["step_order"],
-        "User Prompt": turn["user_input"],
-        "Keywords": ", ".join(turn["expected_agent_response_keywords"]),
-        "Exact?": "Yes" if turn["exact_match_required"] else "No",
-    }
-    for turn in current_case["turns"]
-]
-st.dataframe(turn_rows, hide_index=True, use_container_width=True)
+st.dataframe(build_turn_frame(current_case["turns"]), hide_index=True, use_container_width=True)
 
 with st.form("run-form"):
     st.markdown("### Execute Test")
@@ -152,7 +243,7 @@ if submitted:
     metadata: Dict[str, Any] = {}
     if metadata_input.strip():
         try:
-            metadata = json.loads(metadata_input)
+            metadata = orjson.loads(metadata_input)
         except Exception as exc:  # noqa: BLE001
             st.error(f"Metadata JSON invalid: {exc}")
             metadata = {}
@@ -215,7 +306,7 @@ if run_result and run_result.get("evaluation"):
 
 st.markdown("### Recent Runs")
 try:
-    recent_runs = load_recent_runs(base_url, api_key, api_key_header, limit=5)
+    recent_runs = load_recent_runs(base_url, api_key, api_key_header, limit=RECENT_RUNS_LIMIT)
     if recent_runs:
         st.table(
             [
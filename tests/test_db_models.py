@@ -0,0 +1,41 @@
+import pytest
+from pydantic import ValidationError
+from sqlmodel import Session, SQLModel, create_engine
+
+from core.config import Settings
+from models.db_models import TestCaseRecord, TestRun
+
+
+def test_append_transcript_keeps_newest_rows_within_cap() -> None:
+    run = TestRun(test_id="case", provider="twilio")
+    run.append_transcript([{"speaker": "user", "text": "one"}, {"speaker": "agent", "text": "two"}])
+
+    dropped = run.append_transcript([{"speaker": "user", "text": "three"}], max_rows=2)
+
+    assert dropped == 1
+    assert [row["text"] for row in run.transcript] == ["two", "three"]
+
+
+def test_append_transcript_marks_loaded_run_dirty() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(TestCaseRecord(test_id="case", persona="Calm Customer", turns=[]))
+        session.add(TestRun(id="run", test_id="case", provider="twilio"))
+        session.commit()
+
+    with Session(engine) as session:
+        run = session.get(TestRun, "run")
+        run.append_transcript([{"speaker": "user", "text": "hello"}])
+        assert run in session.dirty
+        session.commit()
+
+    with Session(engine) as session:
+        assert session.get(TestRun, "run").transcript == [{"speaker": "user", "text": "hello"}]
+
+
+def test_settings_reject_non_positive_transcript_size() -> None:
+    with pytest.raises(ValidationError):
+        Settings(max_transcript_size=0)
+    with pytest.raises(ValidationError):
+        Settings(max_transcript_size=-5)
@@ -0,0 +1,38 @@
+import pytest
+
+from services.llm import CachedLLMClient
+
+
+class _CountingClient:
+    model = "test-model"
+
+    def __init__(self, temperature: float) -> None:
+        self.temperature = temperature
+        self.calls = 0
+
+    async def generate(self, prompt: str, **kwargs: object) -> str:
+        self.calls += 1
+        return f"{prompt}#{self.calls}"
+
+
+@pytest.mark.asyncio
+async def test_cached_client_reuses_deterministic_responses() -> None:
+    inner = _CountingClient(temperature=0.0)
+    client = CachedLLMClient(inner, max_entries=1)
+
+    assert await client.generate("steer") == "steer#1"
+    assert await client.generate("steer") == "steer#1"
+    assert await client.generate("other") == "other#2"
+    assert await client.generate("steer") == "steer#3"
+    assert client.stats == {"hits": 1, "misses": 3}
+
+
+@pytest.mark.asyncio
+async def test_cached_client_skips_sampled_prompts() -> None:
+    inner = _CountingClient(temperature=0.2)
+    client = CachedLLMClient(inner)
+
+    await client.generate("naturalize")
+    await client.generate("naturalize")
+    assert await client.generate("naturalize", temperature=0) == "naturalize#3"
+    assert inner.calls == 3
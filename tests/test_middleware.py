@@ -0,0 +1,63 @@
+from dataclasses import replace
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api import middleware
+from api.middleware import APIKeyMiddleware
+from core.config import get_settings
+
+
+def _build_client(monkeypatch: pytest.MonkeyPatch, api_key: Optional[str]) -> TestClient:
+    settings = replace(get_settings(), api_key=api_key, api_key_header_name="X-API-Key")
+    monkeypatch.setattr(middleware, "get_settings", lambda: settings)
+
+    app = FastAPI()
+    app.add_middleware(
+        APIKeyMiddleware,
+        exempt_paths=(app.docs_url, app.redoc_url, app.openapi_url, app.swagger_ui_oauth2_redirect_url, "/health"),
+    )
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok"}
+
+    @app.get("/testruns")
+    async def list_test_runs() -> list:
+        return []
+
+    return TestClient(app)
+
+
+def test_missing_or_wrong_key_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _build_client(monkeypatch, api_key="secret")
+
+    assert client.get("/testruns").status_code == 401
+    response = client.get("/testruns", headers={"x-api-key": "wrong"})
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid or missing API key"}
+
+
+@pytest.mark.parametrize("header_name", ["x-api-key", "X-API-Key", "X-Api-KEY"])
+def test_correct_key_is_accepted_with_any_header_case(monkeypatch: pytest.MonkeyPatch, header_name: str) -> None:
+    client = _build_client(monkeypatch, api_key="secret")
+
+    response = client.get("/testruns", headers={header_name: "secret"})
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.parametrize("path", ["/docs", "/openapi.json", "/health"])
+def test_exempt_paths_skip_the_key_check(monkeypatch: pytest.MonkeyPatch, path: str) -> None:
+    client = _build_client(monkeypatch, api_key="secret")
+
+    assert client.get(path).status_code == 200
+
+
+def test_no_key_required_when_api_key_unset(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _build_client(monkeypatch, api_key=None)
+
+    assert client.get("/testruns").status_code == 200
@@ -30,9 +30,60 @@ async def test_simulator_respects_script_without_disfluencies() -> None:
 def test_simulator_injects_disfluency(monkeypatch: pytest.MonkeyPatch) -> None:
     simulator = SimulatorAgent(disfluency_rate=1.0)
 
-    monkeypatch.setattr("services.simulator.random.random", lambda: 0.0)
-    monkeypatch.setattr("services.simulator.random.choice", lambda seq: seq[0])
-    monkeypatch.setattr("services.simulator.random.randint", lambda _a, _b: 0)
+    monkeypatch.setattr(simulator._rng, "random", lambda: 0.0)
+    monkeypatch.setattr(simulator._rng, "choice", lambda seq: seq[0])
+    monkeypatch.setattr(simulator._rng, "randint", lambda _a, _b: 0)
 
     output = simulator._inject_disfluencies("I need assistance")
     assert output.startswith("um ")
+
+
+def test_simulator_disfluencies_are_reproducible_with_seed() -> None:
+    outputs = {
+        SimulatorAgent(disfluency_rate=1.0, seed=7)._inject_disfluencies("I need assistance today")
+        for _ in range(3)
+    }
+    assert len(outputs) == 1
+
+
+class _ScriptedLLM:
+    def __init__(self, batch_reply: str) -> None:
+        self.batch_reply = batch_reply
+        self.prompts: list = []
+
+    async def generate(self, prompt: str, **kwargs: object) -> str:
+        self.prompts.append(prompt)
+        return self.batch_reply if "JSON array" in prompt else "single restatement"
+
+
+def _two_turn_case() -> TestCase:
+    return TestCase(
+        test_id="sim_batch",
+        persona="Direct",
+        turns=[
+            TurnExpectation(step_order=1, user_input="Hi agent", expected_agent_response_keywords=["hi"]),
+            TurnExpectation(step_order=2, user_input="Bye agent", expected_agent_response_keywords=["bye"]),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_simulator_naturalizes_all_turns_in_one_request() -> None:
+    llm = _ScriptedLLM('```json\n["Hello there", "Goodbye now"]\n```')
+    simulator = SimulatorAgent(llm_client=llm, naturalize_user_prompts=True)
+
+    transcript = await simulator.run(_two_turn_case())
+
+    assert len(llm.prompts) == 1
+    assert [row["text"] for row in transcript if row["speaker"] == "user"] == ["Hello there", "Goodbye now"]
+
+
+@pytest.mark.asyncio
+async def test_simulator_falls_back_to_per_turn_naturalization() -> None:
+    llm = _ScriptedLLM("Sorry, I can't format that.")
+    simulator = SimulatorAgent(llm_client=llm, naturalize_user_prompts=True)
+
+    transcript = await simulator.run(_two_turn_case())
+
+    assert len(llm.prompts) == 3
+    assert {row["text"] for row in transcript if row["speaker"] == "user"} == {"single restatement"}
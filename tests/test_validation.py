@@ -1,3 +1,5 @@
+import pytest
+
 from models.test_cases import TestCase, TurnExpectation
 from services.validation import validate_turn_by_turn
 
@@ -41,4 +43,24 @@ def test_validate_turn_by_turn_generates_metrics() -> None:
     assert metrics["failure_steps"] == [2]
     assert metrics["first_failure_step"] == 2
     assert metrics["user_deviation_detected"] is False
-```}What? need valid JSON. format? tool expects JSON. Provide 
\ No newline at end of file
+
+
+def test_contains_keywords_automaton_matches_substring_checks() -> None:
+    pytest.importorskip("ahocorasick")
+    from services import validation
+
+    # "bill" is repeated and overlaps "billing", as "plan" overlaps "planet".
+    keywords = frozenset(
+        ["account", "bill", "billing", "plan", "planet", "review", "details", "refund", "offer", "bill"]
+    )
+    assert len(keywords) >= validation._AUTOMATON_MIN_KEYWORDS
+    texts = [
+        "Your billing account plan review: details of our planet offer, refund pending",
+        "Your billing account plan review: details of our planet offer",
+        "Bill bill BILL: account plan review details offer",
+        "",
+    ]
+    for text in texts:
+        normalized = validation._normalize(text)
+        expected = all(keyword in normalized for keyword in keywords)
+        assert validation._contains_keywords(text, keywords) is expected